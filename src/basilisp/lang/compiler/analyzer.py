@@ -3529,7 +3529,7 @@ _SPECIAL_FORM_HANDLERS: Mapping[sym.Symbol, SpecialFormHandler] = {
 @_analyze_form.register(ISeq)
 @_with_loc
 def _list_node(form: ISeq, ctx: AnalyzerContext) -> Node:
-    if form == llist.EMPTY:
+    if form.is_empty:
         with ctx.quoted():
             return _const_node(form, ctx)
 
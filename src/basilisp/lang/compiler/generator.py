@@ -8,6 +8,7 @@ import functools
 import hashlib
 import logging
 import pickle  # nosec B403
+import pickletools
 import re
 import uuid
 from collections.abc import Collection, Iterable, Mapping, MutableMapping
@@ -3683,9 +3684,13 @@ def _const_val_to_py_ast(
     Nested values in collections for :const nodes are not analyzed, so recursive
     structures need to call into this function to generate Python AST nodes for
     nested elements. For top-level :const Lisp AST nodes, see
-    `_const_node_to_py_ast`."""
+    `_const_node_to_py_ast`.
+
+    Pickled constants are passed through `pickletools.optimize` to strip unused
+    memo opcodes, which shrinks the emitted byte string and reduces the work done
+    by `pickle.loads` each time the generated module is loaded."""
     try:
-        serialized = pickle.dumps(form)
+        serialized = pickletools.optimize(pickle.dumps(form))
     except (pickle.PicklingError, RecursionError) as e:
         # For types without custom "constant" handling code, we defer to pickle
         # to generate a representation that can be reloaded from the generated
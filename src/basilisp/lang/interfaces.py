@@ -59,8 +59,10 @@ class ICounted(Sized, ABC):
     """``ICounted`` is a marker interface for types can produce their length in
     constant time.
 
-    All the builtin collections are ``ICounted``, except Lists whose length is
-    determined by counting all the elements in the list in linear time.
+    All the builtin collections are ``ICounted``, except Lists. Lists do track their
+    length and can produce it in constant time, but they are deliberately not marked
+    ``ICounted`` to preserve the existing behavior of :lpy:fn:`counted?` and
+    :lpy:fn:`bounded-count` for Lists.
 
     .. seealso::
 
@@ -562,6 +564,8 @@ class IEvolveableCollection(Generic[T_tcoll_co]):
 
        :lpy:fn:`transient`"""
 
+    __slots__ = ()
+
     @abstractmethod
     def to_transient(self) -> T_tcoll_co:
         raise NotImplementedError()
@@ -713,7 +717,7 @@ def seq_equals(s1: Union["ISeq", ISequential], s2: Any) -> bool:
 
     sentinel = object()
     for e1, e2 in itertools.zip_longest(s1, s2, fillvalue=sentinel):  # type: ignore[arg-type]
-        if bool(e1 is sentinel) or bool(e2 is sentinel):
+        if e1 is sentinel or e2 is sentinel:
             return False
         if e1 != e2:
             return False
@@ -48,7 +48,9 @@ class Keyword(ILispObject, INamed):
     def __eq__(self, other):
         return self is other or (
             isinstance(other, Keyword)
-            and (self._name, self._ns) == (other._name, other._ns)
+            and self._hash == other._hash
+            and self._name == other._name
+            and self._ns == other._ns
         )
 
     def __hash__(self):
@@ -127,9 +129,17 @@ def keyword_from_hash(kw_hash: int, name: str, ns: Optional[str] = None) -> Keyw
     performance improvements when creating the same keyword repeatedly."""
     global _INTERN
 
+    # The intern cache is an immutable map which is only ever swapped out wholesale
+    # while holding the lock, so it is safe to check for an existing keyword before
+    # acquiring the lock. Only keywords which have not yet been interned must pay
+    # the cost of locking.
+    found = _INTERN.val_at(kw_hash)
+    if found is not None:
+        return found
+
     with _LOCK:
         found = _INTERN.val_at(kw_hash)
-        if found:
+        if found is not None:
             return found
         kw = Keyword(name, ns=ns)
         _INTERN = _INTERN.assoc(kw_hash, kw)
@@ -7,7 +7,9 @@ from typing_extensions import Unpack
 from basilisp.lang.interfaces import IPersistentList, IPersistentMap, ISeq, IWithMeta
 from basilisp.lang.obj import PrintSettings
 from basilisp.lang.obj import seq_lrepr as _seq_lrepr
+from basilisp.lang.seq import _TO_SEQ_DISPATCH
 from basilisp.lang.seq import EMPTY as _EMPTY_SEQ
+from basilisp.lang.seq import _to_seq_iseq
 
 T = TypeVar("T")
 
@@ -18,11 +20,25 @@ class PersistentList(IPersistentList[T], ISeq[T], IWithMeta):
     Do not instantiate directly. Instead use the l() and list() factory
     methods below."""
 
-    __slots__ = ("_inner", "_meta")
+    __slots__ = ("_inner", "_count", "_meta", "_hash", "is_empty")
 
-    def __init__(self, wrapped: "PList[T]", meta=None) -> None:
+    # Emptiness is known when the list is constructed, so it is stored directly in a
+    # slot rather than computed by a property on every access.
+    is_empty: bool
+
+    def __init__(
+        self, wrapped: "PList[T]", meta=None, count: Optional[int] = None
+    ) -> None:
         self._inner = wrapped
+        # PList computes its length by walking every node, so the count is tracked
+        # here instead. Callers which already know the count should provide it.
+        #
+        # Internal callers pass arguments positionally, since calling a class with
+        # keyword arguments is measurably slower on this very hot path.
+        self._count = len(wrapped) if count is None else count
         self._meta = meta
+        self._hash: Optional[int] = None
+        self.is_empty = self._count == 0
 
     def __bool__(self):
         return True
@@ -32,11 +48,58 @@ class PersistentList(IPersistentList[T], ISeq[T], IWithMeta):
             return PersistentList(self._inner[item])
         return self._inner[item]
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not PersistentList:
+            return super().__eq__(other)
+
+        # Comparisons between two lists can use the tracked counts to reject lists
+        # of different lengths without examining their elements. Cached hashes must
+        # not be used to reject lists, since some equal elements (such as vectors
+        # and lists) do not hash identically.
+        if self._count != other._count:
+            return False
+
+        l1, l2 = self._inner, other._inner
+        while l1:
+            if l1.first != l2.first:
+                return False
+            l1, l2 = l1.rest, l2.rest
+        return True
+
     def __hash__(self):
-        return hash(self._inner)
+        # Lists must hash identically to other equal sequences, so the hash cannot be
+        # computed incrementally; it is instead computed once on demand and cached.
+        if self._hash is None:
+            self._hash = hash(self._inner)
+        return self._hash
+
+    def __iter__(self):
+        # Iterate the wrapped PList directly rather than via `ISeq.__iter__`, which
+        # would allocate a new PersistentList wrapper for every `.rest` call.
+        return iter(self._inner)
 
     def __len__(self):
-        return len(self._inner)
+        return self._count
+
+    def __reduce__(self):
+        # Returning a string causes the empty list singleton to be pickled as a
+        # reference to the module global, preserving its identity when unpickled.
+        if self is EMPTY:
+            return "EMPTY"
+        return list, (tuple(self._inner), self._meta)
+
+    def __setstate__(self, state):
+        # Lists pickled before `__reduce__` was defined are restored from the default
+        # slot state, which does not include the derived slots.
+        if isinstance(state, tuple):
+            _, state = state
+        self._inner = state["_inner"]
+        self._meta = state.get("_meta")
+        self._count = len(self._inner)
+        self._hash = None
+        self.is_empty = self._count == 0
 
     def _lrepr(self, **kwargs: Unpack[PrintSettings]) -> str:
         return _seq_lrepr(self._inner, "(", ")", meta=self._meta, **kwargs)
@@ -46,11 +109,7 @@ class PersistentList(IPersistentList[T], ISeq[T], IWithMeta):
         return self._meta
 
     def with_meta(self, meta: Optional[IPersistentMap]) -> "PersistentList":
-        return list(self._inner, meta=meta)
-
-    @property
-    def is_empty(self):
-        return self._inner is _EMPTY_PLIST
+        return PersistentList(self._inner, meta, self._count)
 
     @property
     def first(self):
@@ -63,19 +122,26 @@ class PersistentList(IPersistentList[T], ISeq[T], IWithMeta):
     def rest(self) -> ISeq[T]:
         if self._inner.rest is _EMPTY_PLIST:
             return _EMPTY_SEQ
-        return PersistentList(self._inner.rest)
+        return PersistentList(self._inner.rest, None, self._count - 1)
 
     def cons(self, *elems: T) -> "PersistentList[T]":
+        if len(elems) == 1:
+            return PersistentList(
+                self._inner.cons(elems[0]), self._meta, self._count + 1
+            )
+
         l = self._inner
         for elem in elems:
             l = l.cons(elem)
-        return PersistentList(l, meta=self._meta)
+        return PersistentList(l, self._meta, self._count + len(elems))
 
     def empty(self) -> "PersistentList":
+        if self._meta is None:
+            return EMPTY
         return EMPTY.with_meta(self._meta)
 
     def seq(self) -> Optional[ISeq[T]]:
-        if len(self._inner) == 0:
+        if self._count == 0:
             return None
         return super().seq()
 
@@ -88,14 +154,18 @@ class PersistentList(IPersistentList[T], ISeq[T], IWithMeta):
         return cast(PersistentList, self.rest)
 
 
-EMPTY: PersistentList = PersistentList(plist())
+EMPTY: PersistentList = PersistentList(plist(), None, 0)
+
+_TO_SEQ_DISPATCH[PersistentList] = _to_seq_iseq
 
 
 def list(members, meta=None) -> PersistentList:  # pylint:disable=redefined-builtin
     """Creates a new list."""
-    return PersistentList(plist(iterable=members), meta=meta)
+    return PersistentList(plist(iterable=members), meta)
 
 
 def l(*members, meta=None) -> PersistentList:  # noqa
     """Creates a new list from members."""
-    return PersistentList(plist(iterable=members), meta=meta)
+    if not members and meta is None:
+        return EMPTY
+    return PersistentList(plist(iterable=members), meta, len(members))
@@ -215,7 +215,7 @@ class PersistentMap(
     Do not instantiate directly. Instead use the m() and map() factory
     methods below."""
 
-    __slots__ = ("_inner", "_meta")
+    __slots__ = ("_inner", "_meta", "__weakref__")
 
     def __init__(
         self,
@@ -1,7 +1,7 @@
 import functools
 import threading
 from collections.abc import Iterable
-from typing import Callable, Optional, TypeVar, overload
+from typing import Any, Callable, Optional, TypeVar, Union, overload
 
 from basilisp.lang.interfaces import (
     IPersistentMap,
@@ -10,7 +10,6 @@ from basilisp.lang.interfaces import (
     ISequential,
     IWithMeta,
 )
-from basilisp.util import Maybe
 
 T = TypeVar("T")
 
@@ -37,9 +36,9 @@ class _EmptySequence(IWithMeta, ISequential, ISeq[T]):
     def with_meta(self, meta: Optional[IPersistentMap]) -> "_EmptySequence[T]":
         return _EmptySequence(meta=meta)
 
-    @property
-    def is_empty(self) -> bool:
-        return True
+    # The empty seq is always empty, so this is a plain class attribute rather than
+    # a property to avoid a function call on every check.
+    is_empty = True
 
     @property
     def first(self) -> Optional[T]:
@@ -72,12 +71,11 @@ class Cons(ISeq[T], ISequential, IWithMeta):
         meta: Optional[IPersistentMap] = None,
     ) -> None:
         self._first = first
-        self._rest = Maybe(seq).or_else_get(EMPTY)
+        self._rest = seq if seq is not None else EMPTY
         self._meta = meta
 
-    @property
-    def is_empty(self) -> bool:
-        return False
+    # As for `_EmptySequence`, a Cons cell can never be empty.
+    is_empty = False
 
     @property
     def first(self) -> Optional[T]:
@@ -106,6 +104,11 @@ class Cons(ISeq[T], ISequential, IWithMeta):
 
 LazySeqGenerator = Callable[[], Optional[ISeq[T]]]
 
+# Sentinel value stored in `LazySeq._seq` until the sequence has been fully realized.
+# `None` cannot be used for this purpose since it is the realized value of an empty
+# LazySeq.
+_UNREALIZED = object()
+
 
 class LazySeq(IWithMeta, ISequential, ISeq[T]):
     """LazySeqs are wrappers for delaying sequence computation. Create a LazySeq
@@ -126,7 +129,9 @@ class LazySeq(IWithMeta, ISequential, ISeq[T]):
     ) -> None:
         self._gen: Optional[LazySeqGenerator] = gen
         self._obj: Optional[ISeq[T]] = None
-        self._seq: Optional[ISeq[T]] = seq
+        self._seq: Union[Optional[ISeq[T]], object] = (
+            seq if gen is None else _UNREALIZED
+        )
         self._lock = threading.RLock()
         self._meta = meta
 
@@ -145,6 +150,10 @@ class LazySeq(IWithMeta, ISequential, ISeq[T]):
     # perhaps another LazySeq. Finally, the LazySeq attempts to consume all returned
     # LazySeq objects before calling `(seq ...)` on the result, which is cached in the
     # _seq attribute.
+    #
+    # Until that final step, _seq holds the _UNREALIZED sentinel. Once _seq holds any
+    # other value it never changes again, so callers may read it without acquiring
+    # the lock.
 
     def _compute_seq(self) -> Optional[ISeq[T]]:
         if self._gen is not None:
@@ -166,10 +175,18 @@ class LazySeq(IWithMeta, ISequential, ISeq[T]):
             gen = self._gen
             self._gen = None
             self._obj = gen()
-        return self._obj if self._obj is not None else self._seq
+        if self._obj is not None:
+            return self._obj
+        s = self._seq
+        return None if s is _UNREALIZED else s  # type: ignore[return-value]
 
     def seq(self) -> Optional[ISeq[T]]:
+        s = self._seq
+        if s is not _UNREALIZED:
+            return s  # type: ignore[return-value]
+
         with self._lock:
+            had_gen = self._gen is not None
             self._compute_seq()
             if self._obj is not None:
                 o = self._obj
@@ -182,10 +199,33 @@ class LazySeq(IWithMeta, ISequential, ISeq[T]):
                 # only result in evaluating away instances where _another_ LazySeq is
                 # returned rather than a cons cell with a concrete first value. This
                 # loop will not consume the LazySeq in the rest position of the cons.
+                consumed: Optional[list[LazySeq]] = None
                 while isinstance(o, LazySeq):
-                    o = o._compute_seq()  # type: ignore
-                self._seq = to_seq(o)
-            return self._seq
+                    nxt = o._compute_seq()
+                    if o._obj is not None:
+                        if consumed is None:
+                            consumed = []
+                        consumed.append(o)
+                    o = nxt  # type: ignore[assignment]
+                self._seq = s = to_seq(o)
+
+                # Any nested LazySeqs consumed above realize to the same sequence, so
+                # share the result with them. Otherwise, if one of those LazySeqs is
+                # also referenced elsewhere, realizing it would repeat the work above
+                # and (for seqable collections) produce a distinct seq. LazySeqs which
+                # are still realizing (as for re-entrant calls) are never collected.
+                if consumed is not None:
+                    for inner in consumed:
+                        inner._seq = s
+                        inner._obj = None
+            elif had_gen:
+                self._seq = None
+
+            # If neither branch above applied, this is a re-entrant call made while
+            # the generator is still running (as for co-recursive sequences), so the
+            # sequence must appear empty without being marked as realized.
+            s = self._seq
+            return None if s is _UNREALIZED else s  # type: ignore[return-value]
 
     @property
     def is_empty(self) -> bool:
@@ -193,15 +233,17 @@ class LazySeq(IWithMeta, ISequential, ISeq[T]):
 
     @property
     def first(self) -> Optional[T]:
-        if self.is_empty:
+        s = self.seq()
+        if s is None:
             return None
-        return self.seq().first  # type: ignore[union-attr]
+        return s.first
 
     @property
     def rest(self) -> "ISeq[T]":
-        if self.is_empty:
+        s = self.seq()
+        if s is None:
             return EMPTY
-        return self.seq().rest  # type: ignore[union-attr]
+        return s.rest
 
     def cons(self, *elems: T) -> ISeq[T]:  # type: ignore[override]
         l: ISeq = self
@@ -211,6 +253,8 @@ class LazySeq(IWithMeta, ISequential, ISeq[T]):
 
     @property
     def is_realized(self):
+        if self._seq is not _UNREALIZED:
+            return True
         with self._lock:
             return self._gen is None
 
@@ -218,13 +262,29 @@ class LazySeq(IWithMeta, ISequential, ISeq[T]):
         return EMPTY
 
 
+# Maximum length of a Python tuple for which `sequence` will eagerly build the entire
+# sequence, rather than realizing it lazily.
+_EAGER_SEQUENCE_MAX_LEN = 32
+
+
 def sequence(s: Iterable[T], support_single_use: bool = False) -> ISeq[T]:
     """Create a Sequence from Iterable `s`.
 
     By default, raise a ``TypeError`` if `s` is a single-use
     Iterable, unless `fail_single_use` is ``True``.
 
+    Small Python tuples (up to ``_EAGER_SEQUENCE_MAX_LEN`` elements) are built eagerly
+    as a chain of cons cells rather than lazily realizing one element at a time. Since
+    tuples are immutable, the result is indistinguishable from the lazy sequence. All
+    other Iterables (including mutable Python lists) are always realized lazily.
+
     """
+    if type(s) is tuple and len(s) <= _EAGER_SEQUENCE_MAX_LEN:
+        l: ISeq[T] = EMPTY
+        for e in reversed(s):
+            l = Cons(e, l)
+        return l
+
     i = iter(s)
 
     if not support_single_use and i is s:
@@ -264,27 +324,50 @@ def _seq_or_nil(s):
 
 
 @functools.singledispatch
-def to_seq(o) -> Optional[ISeq]:
-    """Coerce the argument o to a ISeq. If o is None, return None."""
+def _to_seq(o) -> Optional[ISeq]:
     return _seq_or_nil(sequence(o))
 
 
-@to_seq.register(type(None))
+@_to_seq.register(type(None))
 def _to_seq_none(_) -> None:
     return None
 
 
-@to_seq.register(ISeq)
+@_to_seq.register(ISeq)
 def _to_seq_iseq(o: ISeq) -> Optional[ISeq]:
     return _seq_or_nil(o)
 
 
-@to_seq.register(LazySeq)
+@_to_seq.register(LazySeq)
 def _to_seq_lazyseq(o: LazySeq) -> Optional[ISeq]:
     # Force evaluation of the LazySeq by calling o.seq() directly.
     return o.seq()
 
 
-@to_seq.register(ISeqable)
+@_to_seq.register(ISeqable)
 def _to_seq_iseqable(o: ISeqable) -> Optional[ISeq]:
     return _seq_or_nil(o.seq())
+
+
+# Handlers for the types most frequently passed to `to_seq`, keyed by exact type.
+# Looking these up directly avoids the overhead of `functools.singledispatch`, which
+# must check the ABC cache token on every call since the registered types are ABCs.
+# Other modules may add entries for their own concrete seq and seqable types.
+_TO_SEQ_DISPATCH: dict[type, Callable[[Any], Optional[ISeq]]] = {
+    type(None): _to_seq_none,
+    _EmptySequence: _to_seq_iseq,
+    Cons: _to_seq_iseq,
+    LazySeq: _to_seq_lazyseq,
+}
+
+
+def to_seq(o) -> Optional[ISeq]:
+    """Coerce the argument o to a ISeq. If o is None, return None."""
+    handler = _TO_SEQ_DISPATCH.get(type(o))
+    if handler is None:
+        return _to_seq(o)
+    return handler(o)
+
+
+to_seq.register = _to_seq.register  # type: ignore[attr-defined]
+to_seq.dispatch = _to_seq.dispatch  # type: ignore[attr-defined]
@@ -73,7 +73,7 @@ class PersistentSet(
     Do not instantiate directly. Instead use the s() and set() factory
     methods below."""
 
-    __slots__ = ("_inner", "_meta")
+    __slots__ = ("_inner", "_meta", "__weakref__")
 
     def __init__(self, m: "_Map[T, T]", meta: Optional[IPersistentMap] = None) -> None:
         self._inner = m
@@ -64,9 +64,15 @@ class Symbol(ILispObject, INamed, IWithMeta):
         return munge(self.name)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Symbol):
             return False
-        return self._ns == other._ns and self._name == other._name
+        return (
+            self._hash == other._hash
+            and self._name == other._name
+            and self._ns == other._ns
+        )
 
     def __hash__(self):
         return self._hash
@@ -92,6 +98,9 @@ class Symbol(ILispObject, INamed, IWithMeta):
         except (AttributeError, TypeError):
             return None
 
+    def __reduce__(self):
+        return Symbol, (self._name, self._ns, self._meta)
+
 
 def symbol(
     name: str, ns: Optional[str] = None, meta: Optional[IPersistentMap] = None
@@ -24,7 +24,12 @@ from basilisp.lang.interfaces import (
 from basilisp.lang.obj import PrintSettings
 from basilisp.lang.obj import seq_lrepr as _seq_lrepr
 from basilisp.lang.reduced import Reduced
-from basilisp.lang.seq import iterator_sequence, sequence
+from basilisp.lang.seq import (
+    _TO_SEQ_DISPATCH,
+    _to_seq_iseqable,
+    iterator_sequence,
+    sequence,
+)
 from basilisp.util import partition
 
 T = TypeVar("T")
@@ -99,7 +104,7 @@ class PersistentVector(
     Do not instantiate directly. Instead use the v() and vec() factory
     methods below."""
 
-    __slots__ = ("_inner", "_meta")
+    __slots__ = ("_inner", "_meta", "__weakref__")
 
     def __init__(
         self, wrapped: "PVector[T]", meta: Optional[IPersistentMap] = None
@@ -286,6 +291,9 @@ class MapEntry(IMapEntry[K, V], PersistentVector[Union[K, V]]):
 
 EMPTY: PersistentVector = PersistentVector(pvector(()))
 
+_TO_SEQ_DISPATCH[PersistentVector] = _to_seq_iseqable
+_TO_SEQ_DISPATCH[MapEntry] = _to_seq_iseqable
+
 
 def vector(
     members: Iterable[T], meta: Optional[IPersistentMap] = None
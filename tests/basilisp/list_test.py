@@ -4,6 +4,8 @@ import pytest
 
 from basilisp.lang import list as llist
 from basilisp.lang import map as lmap
+from basilisp.lang import seq as lseq
+from basilisp.lang import vector as vec
 from basilisp.lang.interfaces import (
     ILispObject,
     IPersistentCollection,
@@ -40,6 +42,61 @@ def test_list_slice():
     assert isinstance(llist.l(1, 2, 3)[1:], llist.PersistentList)
 
 
+def test_list_iter():
+    assert [] == [e for e in llist.EMPTY]
+    assert [1] == [e for e in llist.l(1)]
+    assert [1, 2, 3] == [e for e in llist.l(1, 2, 3)]
+    assert [1, 2, 3] == [e for e in llist.l(0, 1, 2, 3).rest]
+
+
+def test_list_len():
+    assert 0 == len(llist.EMPTY)
+    assert 0 == len(llist.l())
+    assert 3 == len(llist.l(1, 2, 3))
+    assert 3 == len(llist.list(range(3)))
+    assert 2 == len(llist.l(1, 2, 3).rest)
+    assert 2 == len(llist.l(1, 2, 3)[1:])
+    assert 5 == len(llist.l(1, 2, 3).cons(4, 5))
+    assert 3 == len(llist.l(1, 2, 3).with_meta(lmap.m(tag="async")))
+
+
+def test_list_equals():
+    l = llist.l(1, 2, 3)
+    assert l == l
+    assert llist.l(1, 2, 3) == l
+    assert l.cons(0) == l.cons(0)
+    assert l.with_meta(lmap.m(tag="async")) == l
+    assert llist.EMPTY == llist.list([])
+    assert lseq.sequence([1, 2, 3]) == l
+    assert l == lseq.sequence([1, 2, 3])
+
+    assert llist.l(1, 2) != l
+    assert llist.l(1, 2, 4) != l
+    assert l.cons(0) != l.cons(1)
+    assert llist.EMPTY != l
+
+    # Equality must not depend on whether either list has been hashed, even for
+    # elements which are equal but hash differently.
+    l3 = llist.l(vec.v(1, 2))
+    l4 = llist.l(llist.l(1, 2))
+    assert l3 == l4
+    hash(l3)
+    hash(l4)
+    assert l3 == l4
+
+    # Elements are always compared, even across a shared tail.
+    t = llist.l(float("nan"))
+    assert t.cons(1) != t.cons(1)
+
+
+def test_list_hash():
+    l = llist.l(1, 2, 3)
+    assert hash(l) == hash(l)
+    assert hash(llist.l(1, 2, 3)) == hash(l)
+    assert hash(lseq.sequence([1, 2, 3])) == hash(l)
+    assert hash(lseq.EMPTY) == hash(llist.EMPTY)
+
+
 def test_list_bool():
     assert True is bool(llist.EMPTY)
 
@@ -65,6 +122,7 @@ def test_list_empty():
     assert l1.empty() == llist.EMPTY
     assert l1.empty().meta == meta
     assert llist.EMPTY.empty().meta is None
+    assert llist.EMPTY is llist.l(keyword("kw1")).empty()
 
 
 def test_peek():
@@ -145,6 +203,43 @@ def test_list_pickleability(pickle_protocol: int, o: llist.PersistentList):
     assert o == pickle.loads(pickle.dumps(o, protocol=pickle_protocol))
 
 
+def test_empty_list_pickleability(pickle_protocol: int):
+    assert llist.EMPTY is pickle.loads(
+        pickle.dumps(llist.EMPTY, protocol=pickle_protocol)
+    )
+    assert llist.EMPTY is llist.l()
+
+
+def test_list_pickleability_with_meta(pickle_protocol: int):
+    meta = lmap.m(tag=keyword("async"))
+    o = pickle.loads(
+        pickle.dumps(llist.l(keyword("kw1"), 2, meta=meta), protocol=pickle_protocol)
+    )
+    assert llist.l(keyword("kw1"), 2) == o
+    assert meta == o.meta
+
+
+def test_long_list_pickleability(pickle_protocol: int):
+    o = llist.list(range(10000))
+    assert o == pickle.loads(pickle.dumps(o, protocol=pickle_protocol))
+
+
+def test_unpickle_list_from_slot_state():
+    # `llist.l(1, 2, 3)` as pickled by versions which stored only `_inner` and `_meta`
+    o = pickle.loads(
+        b"\x80\x02cbasilisp.lang.list\nPersistentList\nq\x00)\x81q\x01N}q\x02"
+        b"(X\x06\x00\x00\x00_innerq\x03cpyrsistent._plist\nplist\nq\x04]q\x05"
+        b"(K\x01K\x02K\x03e\x85q\x06Rq\x07X\x05\x00\x00\x00_metaq\x08Nu\x86q\tb."
+    )
+    assert llist.l(1, 2, 3) == o
+    assert 3 == len(o)
+    assert not o.is_empty
+    assert hash(llist.l(1, 2, 3)) == hash(o)
+    assert None is o.meta
+    assert llist.l(0, 1, 2, 3) == o.cons(0)
+    assert llist.l(2, 3) == o.rest
+
+
 @pytest.mark.parametrize(
     "l,str_repr",
     [
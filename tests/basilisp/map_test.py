@@ -1,4 +1,5 @@
 import pickle
+import weakref
 from collections.abc import Mapping
 
 import pytest
@@ -61,6 +62,11 @@ def test_assoc():
     assert m2.assoc("c", 8, "d", 12).meta == meta
 
 
+def test_map_weakref():
+    o = lmap.map({"a": 1})
+    assert o is weakref.ref(o)()
+
+
 def test_map_bool():
     assert True is bool(lmap.EMPTY)
 
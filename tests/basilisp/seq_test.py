@@ -16,6 +16,21 @@ def test_to_sequence():
     assert not lseq.sequence([1]).is_empty
     assert llist.l(1, 2, 3) == lseq.sequence([1, 2, 3])
     assert not lseq.sequence([1, 2, 3]).is_empty
+    assert lseq.EMPTY is lseq.sequence(())
+    assert llist.l(1, 2, 3) == lseq.sequence((1, 2, 3))
+    assert not lseq.sequence((1, 2, 3)).is_empty
+
+    big = tuple(range(lseq._EAGER_SEQUENCE_MAX_LEN + 1))
+    assert isinstance(lseq.sequence(big), lseq.LazySeq)
+    assert llist.list(big) == lseq.sequence(big)
+
+
+def test_sequence_of_list_is_lazy():
+    l = [1, 2, 3]
+    s = lseq.sequence(l)
+    assert isinstance(s, lseq.LazySeq)
+    l.append(4)
+    assert llist.l(1, 2, 3, 4) == s
 
 
 def test_lazy_sequence():
@@ -85,6 +100,46 @@ def test_lazy_sequence():
         s.first
 
 
+def test_lazy_sequence_reentrant_realization():
+    seen = []
+
+    def gen():
+        seen.append(s.is_empty)
+        seen.append(s.is_realized)
+        return lseq.sequence([1])
+
+    s = lseq.LazySeq(gen)
+    assert not s.is_realized
+    assert 1 == s.first
+    assert [True, True] == seen
+    assert s.is_realized
+    assert not s.is_empty
+    assert llist.l(1) == s
+
+
+def test_nested_lazy_sequence_shares_realized_seq():
+    inner = lseq.LazySeq(lambda: vec.v(1, 2, 3))
+    outer = lseq.LazySeq(lambda: lseq.LazySeq(lambda: inner))
+    assert llist.l(1, 2, 3) == outer
+    assert inner.is_realized
+    assert inner.seq() is outer.seq()
+
+
+def test_deeply_nested_lazy_sequence():
+    def wrap(inner):
+        return lseq.LazySeq(lambda: inner)
+
+    s = lseq.sequence([1, 2])
+    innermost = s = wrap(s)
+    for _ in range(10000):
+        s = wrap(s)
+
+    assert 1 == s.first
+    assert llist.l(1, 2) == s
+    assert innermost.is_realized
+    assert innermost.seq() is s.seq()
+
+
 def test_empty_sequence():
     empty = lseq.sequence([])
     assert empty.is_empty
@@ -149,3 +204,31 @@ def test_seq_equals():
 
     assert lseq.sequence(vec.v(1, 2, 3)) == llist.l(1, 2, 3)
     assert False is (lseq.sequence(vec.v(1, 2, 3)) == kw.keyword("abc"))
+
+
+def test_to_seq():
+    assert None is lseq.to_seq(None)
+    assert None is lseq.to_seq(lseq.EMPTY)
+    assert None is lseq.to_seq(llist.EMPTY)
+    assert None is lseq.to_seq(vec.EMPTY)
+    assert None is lseq.to_seq(lseq.LazySeq(lambda: None))
+
+    l = llist.l(1, 2, 3)
+    assert l is lseq.to_seq(l)
+    assert llist.l(1, 2, 3) == lseq.to_seq(vec.v(1, 2, 3))
+    assert llist.l(1, 2) == lseq.to_seq(vec.MapEntry.of(1, 2))
+    assert llist.l(1, 2, 3) == lseq.to_seq([1, 2, 3])
+
+
+def test_to_seq_register():
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    @lseq.to_seq.register(Point)
+    def _to_seq_point(o):
+        return llist.l(o.x, o.y)
+
+    assert _to_seq_point is lseq.to_seq.dispatch(Point)
+    assert llist.l(1, 2) == lseq.to_seq(Point(1, 2))
@@ -1,5 +1,6 @@
 import pickle
 import typing
+import weakref
 
 import pytest
 
@@ -42,6 +43,11 @@ def test_set_as_function():
     assert 3 == lset.s(1, 2, 3)(3)
 
 
+def test_set_weakref():
+    o = lset.s(1)
+    assert o is weakref.ref(o)()
+
+
 def test_set_bool():
     assert True is bool(lset.EMPTY)
 
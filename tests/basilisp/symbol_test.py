@@ -86,3 +86,10 @@ def test_symbol_str_and_repr():
     sym = symbol("sym")
     assert str(sym) == "sym"
     assert repr(sym) == "sym"
+
+
+def test_symbol_pickleability_with_meta(pickle_protocol: int):
+    meta = lmap.m(tag=keyword("async"))
+    o = pickle.loads(pickle.dumps(symbol("sym", meta=meta), protocol=pickle_protocol))
+    assert symbol("sym") == o
+    assert meta == o.meta
@@ -1,4 +1,5 @@
 import pickle
+import weakref
 
 import pytest
 
@@ -73,6 +74,11 @@ def test_vector_empty():
     assert vec.EMPTY.meta is None
 
 
+def test_vector_weakref():
+    o = vec.v(1)
+    assert o is weakref.ref(o)()
+
+
 def test_vector_bool():
     assert True is bool(vec.EMPTY)
 